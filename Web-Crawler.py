@@ -1,9 +1,15 @@
+import os
 import sys
 import time
+import asyncio
 import json
 import csv
 import re
+import html
+import codecs
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Dict, Set, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
@@ -16,18 +22,53 @@ from PyQt6.QtWidgets import (
 )
 
 try:
-    import requests
+    import aiohttp
 except Exception:
-    requests = None
+    aiohttp = None
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    from bs4.dammit import EncodingDetector
 except Exception:
     BeautifulSoup = None
+    SoupStrainer = None
+    EncodingDetector = None
+
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except Exception:
+    CachedSession = None
+    SQLiteBackend = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# prefer the C based lxml parser, fall back to the builtin one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except Exception:
+    HTML_PARSER = 'html.parser'
+
+# only links and forms are used, so skip building the rest of the tree.
+# form fields are kept as descendants of the matched <form> tags.
+PARSE_FILTER = SoupStrainer(['a', 'form']) if SoupStrainer else None
+FORM_FILTER = SoupStrainer('form') if SoupStrainer else None
+
+# number of pages fetched concurrently by the crawler
+CONCURRENCY = 16
+# number of URLs remembered by the canonicalization caches
+URL_CACHE_SIZE = 100_000
+# on-disk HTTP cache used when "Use HTTP cache" is checked
+HTTP_CACHE_NAME = 'crawl_cache'
+HTTP_CACHE_EXPIRE = 3600  # seconds
 
 # Data models
 
-@dataclass
+# slots keep per-node memory down on large crawls
+@dataclass(slots=True)
 class NodeInfo:
     url: str
     status: Optional[int] = None
@@ -46,31 +87,122 @@ class NodeInfo:
 
 # Helper functions
 
-def canonicalize(url: str) -> str:
-    """Return canonical URL without query and fragment (used for node identity)."""
+# media types worth parsing for links and forms
+_HTML_TYPES = ('text/html', 'application/xhtml+xml')
+# hrefs starting with any of these never lead to a crawlable page
+_SKIP_SCHEMES = ('mailto:', 'javascript:', 'tel:', 'data:', 'blob:', '#', 'about:')
+_MULTISLASH = re.compile(r'/+')
+# link and form extraction straight from the response bytes
+_HREF_RE = re.compile(rb'<a\b[^>]*?\shref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+_FORM_RE = re.compile(rb'<form\b[^>]*>.*?</form>', re.IGNORECASE | re.DOTALL)
+# RFC 3986 appendix B, with the scheme restricted to the characters urlparse accepts
+_URL_RE = re.compile(r'^(?:([A-Za-z][A-Za-z0-9+.-]*):)?(?://([^/?#]*))?([^?#]*)(?:\?([^#]*))?(?:#.*)?$')
+
+def _split_url(url: str) -> Optional[Tuple[str, str, str, str]]:
+    """Split an absolute URL into (scheme, netloc, path, query) with a single regex match.
+
+    Returns None for anything the regex can't handle exactly like urlparse
+    (relative URLs, path params, control characters).
+    """
+    if not url.isprintable():
+        return None
+    m = _URL_RE.match(url)
+    if m is None:
+        return None
+    scheme, netloc, path, query = m.groups()
+    if not scheme or not netloc or ';' in path:
+        return None
+    return scheme.lower(), netloc, path, query or ''
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def fast_canonicalize(url: str) -> str:
+    """Same result as canonicalize() but avoids urlparse for ordinary absolute URLs."""
+    parts = _split_url(url)
+    if parts is None:
+        return normalize(url)[0]
+    scheme, netloc, path, _ = parts
+    return f"{scheme}://{netloc}{_MULTISLASH.sub('/', path).rstrip('/') or '/'}"
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def normalize(url: str) -> Tuple[str, str, bool]:
+    """Parse url once and return (canonical url, url without fragment, has query)."""
+    parts = _split_url(url)
+    if parts is not None:
+        scheme, netloc, path, query = parts
+        canon = f"{scheme}://{netloc}{_MULTISLASH.sub('/', path).rstrip('/') or '/'}"
+        stripped = f'{scheme}://{netloc}{path}?{query}' if query else f'{scheme}://{netloc}{path}'
+        return canon, stripped, bool(query)
+    # fall back to urlparse for anything unusual
     p = urlparse(url)
-    path = p.path or '/'
     # remove duplicate slashes
-    path = re.sub(r'/+', '/', path)
+    path = _MULTISLASH.sub('/', p.path or '/')
     canon = urlunparse((p.scheme, p.netloc, path.rstrip('/') or '/', '', '', ''))
-    return canon
+    stripped = urlunparse((p.scheme, p.netloc, p.path or '', p.params, p.query, ''))
+    return canon, stripped, bool(p.query)
+
+def canonicalize(url: str) -> str:
+    """Return canonical URL without query and fragment (used for node identity)."""
+    return fast_canonicalize(url)
 
 def strip_fragment(url: str) -> str:
-    p = urlparse(url)
-    return urlunparse((p.scheme, p.netloc, p.path or '', p.params, p.query, ''))
+    return normalize(url)[1]
 
 def has_query(url: str) -> bool:
-    return bool(urlparse(url).query)
+    return normalize(url)[2]
+
+def extract_links(raw: bytes, encoding: Optional[str], strict: bool = False) -> Tuple[List[str], List[Tuple[Optional[str], str, List[str]]]]:
+    """Return (hrefs, forms) found in a page; each form is (action, method, input names).
+
+    By default hrefs are matched with a regex over the raw bytes and only the
+    <form> blocks go through BeautifulSoup. strict parses the whole page.
+    encoding is the charset from the response headers, or None to let the
+    page's own <meta charset> decide.
+    """
+    if strict:
+        soup = BeautifulSoup(raw, HTML_PARSER, from_encoding=encoding, parse_only=PARSE_FILTER)
+        hrefs = [a.get('href') for a in soup.find_all('a', href=True)]
+        form_tags = soup.find_all('form')
+    else:
+        # the regex works on bytes, so the charset has to be settled up front
+        encoding = encoding or EncodingDetector.find_declared_encoding(raw, is_html=True) or 'utf-8'
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = 'utf-8'
+        hrefs = [html.unescape((m.group(1) or m.group(2) or m.group(3) or b'').decode(encoding, 'replace'))
+                 for m in _HREF_RE.finditer(raw)]
+        blocks = _FORM_RE.findall(raw)
+        form_tags = []
+        if blocks:
+            soup = BeautifulSoup(b'\n'.join(blocks), HTML_PARSER, from_encoding=encoding, parse_only=FORM_FILTER)
+            form_tags = soup.find_all('form')
+
+    forms = []
+    for f in form_tags:
+        # collect input names
+        inputs = [inp.get('name') for inp in f.find_all(['input', 'select', 'textarea']) if inp.get('name')]
+        forms.append((f.get('action'), (f.get('method') or 'GET').upper(), inputs))
+    return hrefs, forms
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    # compact like orjson, so output doesn't depend on which encoder is installed
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 # Crawler Worker
 
 class CrawlerWorker(QThread):
-    progress = pyqtSignal(object)  # emits (NodeInfo or (from_url, to_url))
+    progress = pyqtSignal(list)  # emits one batch per page: [('node', NodeInfo) | ('edge', from_url, to_url)]
     finished_all = pyqtSignal(dict, dict)  # nodes, adjacency
     log = pyqtSignal(str)
 
     def __init__(self, start_url: str, max_pages: int, max_depth: int, same_domain: bool,
-                 detect_params: bool, delay: float, timeout: int, parent=None):
+                 detect_params: bool, delay: float, timeout: int, concurrency: int = CONCURRENCY,
+                 use_cache: bool = False, strict_parse: bool = False, parent=None):
         super().__init__(parent)
         self.start_url = start_url
         self.max_pages = max_pages
@@ -79,146 +211,214 @@ class CrawlerWorker(QThread):
         self.detect_params = detect_params
         self.delay = delay
         self.timeout = timeout
+        self.concurrency = concurrency
+        self.use_cache = use_cache
+        self.strict_parse = strict_parse
+        # page parsing runs here so it doesn't stall the fetch loop; lxml drops the GIL while parsing
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
         self._nodes: Dict[str, NodeInfo] = {}
         self._adj: Dict[str, Set[str]] = {}
-        self._session = requests.Session() if requests else None
+        # don't carry cached URLs over from a previous crawl
+        normalize.cache_clear()
+        fast_canonicalize.cache_clear()
 
     def run(self):
-        if requests is None or BeautifulSoup is None:
-            self.log.emit('ERROR: missing dependencies. Install `requests` and `beautifulsoup4`.')
-            self.finished_all.emit({}, {})
+        try:
+            if aiohttp is None or BeautifulSoup is None:
+                self.log.emit('ERROR: missing dependencies. Install `aiohttp` and `beautifulsoup4`.')
+                self.finished_all.emit({}, {})
+                return
+
+            asyncio.run(self._run_async())
+        finally:
+            self._pool.shutdown()
+
+        # finalize; out-degrees are kept up to date as edges are added
+        self.log.emit('Crawl finished.')
+        self.finished_all.emit(self._nodes, {k: list(v) for k, v in self._adj.items()})
+
+    async def _run_async(self):
+        self._base_domain = urlparse(self.start_url).netloc
+        # asyncio.Queue is backed by a deque, so get() is O(1)
+        self._queue: asyncio.Queue = asyncio.Queue()  # (url, depth, position in level)
+        # canonical URLs ever queued; doubles as the visited set since each is queued once
+        self._enqueued: Set[str] = set()
+        # links found on the current level, as (parent position, url, canon, depth)
+        self._candidates: List[Tuple[int, str, str, int]] = []
+        self._level_pos = 0
+        self._fetched = 0
+        self._admit(self.start_url, canonicalize(self.start_url), 0)
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        if self.use_cache and CachedSession is not None:
+            # pages are reused for HTTP_CACHE_EXPIRE seconds (or what the server's
+            # Cache-Control allows) and fetched again once they expire
+            cache = SQLiteBackend(cache_name=HTTP_CACHE_NAME, expire_after=HTTP_CACHE_EXPIRE, cache_control=True)
+            session = CachedSession(cache=cache, timeout=timeout)
+        else:
+            session = aiohttp.ClientSession(timeout=timeout)
+        async with session:
+            # each worker handles one page at a time, so at most `concurrency` fetches are in flight
+            workers = [asyncio.create_task(self._worker(session)) for _ in range(self.concurrency)]
+            # crawl one depth level at a time. Links found on a level are only admitted once
+            # the whole level is done, in the order of their parent page within the level,
+            # so every page gets its shortest depth and the max_pages cut matches a serial BFS
+            # no matter which fetches finish first.
+            while True:
+                await self._queue.join()
+                if not self._candidates:
+                    break
+                candidates, self._candidates = self._candidates, []
+                candidates.sort(key=lambda c: c[0])  # stable, keeps link order within a page
+                self._level_pos = 0
+                for _, url, canon, depth in candidates:
+                    self._admit(url, canon, depth)
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(self, session):
+        while True:
+            url, depth, pos = await self._queue.get()
+            try:
+                await self._crawl_page(session, url, depth, pos)
+            except Exception as e:
+                self.log.emit(f'ERROR processing {url}: {e}')
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, url: str, canon: str, depth: int, parent_pos: int):
+        # held back until the current level is done, see _run_async
+        if depth <= self.max_depth:
+            self._candidates.append((parent_pos, url, canon, depth))
+
+    def _admit(self, url: str, canon: str, depth: int):
+        if canon in self._enqueued or len(self._enqueued) >= self.max_pages:
             return
+        self._enqueued.add(canon)
+        self._queue.put_nowait((url, depth, self._level_pos))
+        self._level_pos += 1
+
+    async def _crawl_page(self, session, url: str, depth: int, pos: int):
+        canon, _, url_has_query = normalize(url)
+        # domain filter
+        if self.same_domain:
+            if urlparse(url).netloc != self._base_domain:
+                self.log.emit(f'Skipping external domain: {url}')
+                return
 
-        parsed_start = urlparse(self.start_url)
-        base_domain = parsed_start.netloc
-
-        queue: List[Tuple[str, int]] = []  # (url, depth)
-        start_canon = canonicalize(self.start_url)
-        queue.append((self.start_url, 0))
-        visited: Set[str] = set()
-
-        while queue and len(visited) < self.max_pages:
-            url, depth = queue.pop(0)
-            if depth > self.max_depth:
-                continue
-
-            norm = strip_fragment(url)
-            canon = canonicalize(norm)
-            if canon in visited:
-                continue
-            # domain filter
-            if self.same_domain:
-                if urlparse(url).netloc != base_domain:
-                    self.log.emit(f'Skipping external domain: {url}')
-                    visited.add(canon)
-                    continue
-
-            self.log.emit(f'Fetching ({len(visited)+1}/{self.max_pages}) depth={depth}: {url}')
+        self._fetched += 1
+        self.log.emit(f'Fetching ({self._fetched}/{self.max_pages}) depth={depth}: {url}')
+        page_url = url
+        try:
+            async with session.get(url, allow_redirects=True) as resp:
+                status = resp.status
+                # media type without parameters, already lowercased by aiohttp
+                content_type = resp.content_type
+                page_url = str(resp.url)
+                # hand the raw bytes to the parser with the header charset (None if the
+                # header has none, so <meta charset> still applies), skipping aiohttp's
+                # own decoding and charset detection
+                raw = await resp.read()
+                encoding = resp.charset
+        except Exception as e:
+            status = None
+            content_type = ''
+            raw = b''
+            encoding = None
+            self.log.emit(f'ERROR fetching {url}: {e}')
+
+        node = NodeInfo(url=canon, status=status, accepts_params=False, param_examples=[], out_degree=0)
+        self._nodes[canon] = node
+        edges = self._adj.setdefault(canon, set())
+        batch = [('node', node)]
+
+        # detect parameters by query string
+        if self.detect_params and url_has_query:
+            node.accepts_params = True
+            node.param_examples.append(url)
+            self.log.emit(f'Params detected in URL: {url}')
+
+        # parse HTML only for text/html
+        if content_type in _HTML_TYPES and raw:
             try:
-                resp = self._session.get(url, timeout=self.timeout, allow_redirects=True)
-                status = resp.status_code
-                content_type = resp.headers.get('Content-Type', '')
-                text = resp.text if resp.text else ''
+                loop = asyncio.get_running_loop()
+                hrefs, forms = await loop.run_in_executor(self._pool, extract_links, raw, encoding, self.strict_parse)
+
+                # follow links
+                for href in hrefs:
+                    href = href.strip()
+                    if not href or href.startswith(_SKIP_SCHEMES):
+                        continue
+                    to_canon, abs_url, link_has_query = normalize(urljoin(page_url, href))
+                    # add edge
+                    if to_canon not in edges:
+                        edges.add(to_canon)
+                        node.out_degree += 1
+                        batch.append(('edge', canon, to_canon))
+
+                    # if link has query -> mark target as accepting params
+                    if self.detect_params and link_has_query:
+                        self._nodes.setdefault(to_canon, NodeInfo(url=to_canon, param_examples=[]))
+                        self._nodes[to_canon].accepts_params = True
+                        self._nodes[to_canon].param_examples = self._nodes[to_canon].param_examples or []
+                        self._nodes[to_canon].param_examples.append(abs_url)
+
+                    # enqueue if not seen yet
+                    self._enqueue(abs_url, to_canon, depth + 1, pos)
+
+                # forms (this often indicates parameters)
+                for action, method, inputs in forms:
+                    action_canon, abs_action, _ = normalize(urljoin(page_url, action or page_url))
+                    example = abs_action
+                    if inputs:
+                        # create a sample query string or note for POST
+                        if method == 'GET':
+                            sep = '&' if '?' in abs_action else '?'
+                            qs = '&'.join(f'{n}=example' for n in inputs)
+                            example = f'{abs_action}{sep}{qs}'
+                        else:
+                            example = f'{method} form -> {abs_action} params: ' + ','.join(inputs)
+
+                    if action_canon not in edges:
+                        edges.add(action_canon)
+                        node.out_degree += 1
+                        batch.append(('edge', canon, action_canon))
+
+                    self._nodes.setdefault(action_canon, NodeInfo(url=action_canon, param_examples=[]))
+                    self._nodes[action_canon].accepts_params = True
+                    self._nodes[action_canon].param_examples = self._nodes[action_canon].param_examples or []
+                    self._nodes[action_canon].param_examples.append(example)
+
+                    self._enqueue(abs_action, action_canon, depth + 1, pos)
+
             except Exception as e:
-                status = None
-                content_type = ''
-                text = ''
-                self.log.emit(f'ERROR fetching {url}: {e}')
-
-            node = NodeInfo(url=canon, status=status, accepts_params=False, param_examples=[], out_degree=0)
-            self._nodes[canon] = node
-            self._adj.setdefault(canon, set())
-            visited.add(canon)
-            self.progress.emit(node)
-
-            # detect parameters by query string
-            if self.detect_params and has_query(url):
-                node.accepts_params = True
-                node.param_examples.append(url)
-                self.log.emit(f'Params detected in URL: {url}')
-
-            # parse HTML only for text/html
-            if 'html' in content_type.lower() and text:
-                try:
-                    soup = BeautifulSoup(text, 'html.parser')
-
-                    # find links
-                    anchors = soup.find_all('a', href=True)
-                    for a in anchors:
-                        href = a.get('href')
-                        if href.startswith('mailto:') or href.startswith('javascript:'):
-                            continue
-                        abs_url = urljoin(resp.url, href)
-                        abs_url = strip_fragment(abs_url)
-                        to_canon = canonicalize(abs_url)
-                        # add edge
-                        self._adj[canon].add(to_canon)
-                        self.progress.emit((canon, to_canon))
-
-                        # if link has query -> mark target as accepting params
-                        if self.detect_params and has_query(abs_url):
-                            self._nodes.setdefault(to_canon, NodeInfo(url=to_canon, param_examples=[]))
-                            self._nodes[to_canon].accepts_params = True
-                            self._nodes[to_canon].param_examples = self._nodes[to_canon].param_examples or []
-                            self._nodes[to_canon].param_examples.append(abs_url)
-
-                        # enqueue if not visited
-                        if to_canon not in visited and len(visited) + len(queue) < self.max_pages:
-                            queue.append((abs_url, depth + 1))
-
-                    # find forms (this often indicates parameters)
-                    forms = soup.find_all('form')
-                    for f in forms:
-                        action = f.get('action') or resp.url
-                        method = (f.get('method') or 'GET').upper()
-                        abs_action = urljoin(resp.url, action)
-                        abs_action = strip_fragment(abs_action)
-                        action_canon = canonicalize(abs_action)
-                        # collect input names
-                        inputs = [inp.get('name') for inp in f.find_all(['input', 'select', 'textarea']) if inp.get('name')]
-                        example = abs_action
-                        if inputs:
-                            # create a sample query string or note for POST
-                            if method == 'GET':
-                                qs = '&'.join([f'{n}=example' for n in inputs])
-                                example = abs_action + ('?' if '?' not in abs_action else '&') + qs
-                            else:
-                                example = f'{method} form -> {abs_action} params: {",".join(inputs)}'
-
-                        self._adj[canon].add(action_canon)
-                        self.progress.emit((canon, action_canon))
-
-                        self._nodes.setdefault(action_canon, NodeInfo(url=action_canon, param_examples=[]))
-                        self._nodes[action_canon].accepts_params = True
-                        self._nodes[action_canon].param_examples = self._nodes[action_canon].param_examples or []
-                        self._nodes[action_canon].param_examples.append(example)
-
-                        if action_canon not in visited and len(visited) + len(queue) < self.max_pages:
-                            queue.append((abs_action, depth + 1))
-
-                except Exception as e:
-                    self.log.emit(f'HTML parse error for {url}: {e}')
-
-            # update out-degree
-            for k, s in self._adj.items():
-                if k in self._nodes:
-                    self._nodes[k].out_degree = len(s)
-
-            # delay
-            if self.delay:
-                time.sleep(self.delay)
-
-        # finalize
-        self.log.emit('Crawl finished.')
-        # ensure every node exists in nodes dictionary
-        for n in list(self._adj.keys()):
-            self._nodes.setdefault(n, NodeInfo(url=n, param_examples=[]))
-            self._nodes[n].out_degree = len(self._adj.get(n, []))
+                self.log.emit(f'HTML parse error for {url}: {e}')
 
-        self.finished_all.emit(self._nodes, {k: list(v) for k, v in self._adj.items()})
+        self.progress.emit(batch)
+
+        # delay (per worker, so other fetches keep going)
+        if self.delay:
+            await asyncio.sleep(self.delay)
 
 # GUI
 
+_STYLE = '''
+    QMainWindow { background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #071025, stop:1 #08111b); }
+    QLabel { color: #e6eef8; font-weight: 600; }
+    QLineEdit, QSpinBox, QPlainTextEdit {
+        background: rgba(255,255,255,0.04);
+        border: 1px solid rgba(255,255,255,0.06);
+        color: #e6eef8;
+        padding: 6px;
+        border-radius: 8px;
+    }
+    QTableWidget { background: rgba(255,255,255,0.02); color: #e6eef8; }
+    QPushButton { background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #06b6d4, stop:1 #7c3aed); color: white; padding: 8px; border-radius: 10px; }
+    QPushButton:hover { opacity: 0.9; }
+    QHeaderView::section { background: rgba(255,255,255,0.04); color: #cfeafe; padding: 6px; }
+'''
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -230,6 +430,7 @@ class MainWindow(QMainWindow):
         self.worker: Optional[CrawlerWorker] = None
         self.nodes: Dict[str, NodeInfo] = {}
         self.adj: Dict[str, List[str]] = {}
+        self._row_by_url: Dict[str, int] = {}
 
     def _setup_ui(self):
         central = QWidget()
@@ -273,6 +474,15 @@ class MainWindow(QMainWindow):
         self.timeout_spin.setValue(10)
         grid.addWidget(self.timeout_spin, 3, 3)
 
+        self.use_cache_cb = QCheckBox('Use HTTP cache')
+        self.use_cache_cb.setChecked(False)
+        grid.addWidget(self.use_cache_cb, 3, 4)
+
+        self.strict_parse_cb = QCheckBox('Strict parse')
+        self.strict_parse_cb.setToolTip('Parse whole pages with BeautifulSoup instead of matching links with a regex')
+        self.strict_parse_cb.setChecked(False)
+        grid.addWidget(self.strict_parse_cb, 3, 5)
+
         self.start_btn = QPushButton('Start Crawl')
         grid.addWidget(self.start_btn, 1, 4, 2, 1)
         self.start_btn.clicked.connect(self.on_start)
@@ -301,27 +511,13 @@ class MainWindow(QMainWindow):
         self.draw_graph_btn.clicked.connect(self.on_draw_graph)
 
     def _apply_styles(self):
-        self.setStyleSheet('''
-            QMainWindow { background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #071025, stop:1 #08111b); }
-            QLabel { color: #e6eef8; font-weight: 600; }
-            QLineEdit, QSpinBox, QPlainTextEdit {
-                background: rgba(255,255,255,0.04);
-                border: 1px solid rgba(255,255,255,0.06);
-                color: #e6eef8;
-                padding: 6px;
-                border-radius: 8px;
-            }
-            QTableWidget { background: rgba(255,255,255,0.02); color: #e6eef8; }
-            QPushButton { background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #06b6d4, stop:1 #7c3aed); color: white; padding: 8px; border-radius: 10px; }
-            QPushButton:hover { opacity: 0.9; }
-            QHeaderView::section { background: rgba(255,255,255,0.04); color: #cfeafe; padding: 6px; }
-        ''')
+        self.setStyleSheet(_STYLE)
 
     # Handlers
 
     def on_start(self):
-        if requests is None or BeautifulSoup is None:
-            QMessageBox.critical(self, 'Missing dependency', 'Install `requests` and `beautifulsoup4` (pip install requests beautifulsoup4).')
+        if aiohttp is None or BeautifulSoup is None:
+            QMessageBox.critical(self, 'Missing dependency', 'Install `aiohttp` and `beautifulsoup4` (pip install aiohttp beautifulsoup4).')
             return
         start_url = self.url_edit.text().strip()
         if not start_url:
@@ -333,15 +529,22 @@ class MainWindow(QMainWindow):
         detect_params = bool(self.detect_params_cb.isChecked())
         delay = float(self.delay_spin.value())
         timeout = int(self.timeout_spin.value())
+        use_cache = bool(self.use_cache_cb.isChecked())
+        strict_parse = bool(self.strict_parse_cb.isChecked())
+        if use_cache and CachedSession is None:
+            QMessageBox.information(self, 'Missing libs', 'Install optional library: aiohttp-client-cache (pip install aiohttp-client-cache[sqlite])')
+            return
 
         self.table.setRowCount(0)
+        self._row_by_url.clear()
         self.log_area.clear()
         self.nodes = {}
         self.adj = {}
 
         self.worker = CrawlerWorker(start_url=start_url, max_pages=max_pages, max_depth=max_depth,
                                     same_domain=same_domain, detect_params=detect_params,
-                                    delay=delay, timeout=timeout)
+                                    delay=delay, timeout=timeout, use_cache=use_cache,
+                                    strict_parse=strict_parse)
         self.worker.progress.connect(self.on_progress)
         self.worker.finished_all.connect(self.on_finished_all)
         self.worker.log.connect(self._append_log)
@@ -349,34 +552,41 @@ class MainWindow(QMainWindow):
         self._append_log('Starting crawl...')
         self.worker.start()
 
-    def on_progress(self, data):
-        # data can be NodeInfo or (from, to)
-        if isinstance(data, tuple) and len(data) == 2:
-            frm, to = data
-            # ensure nodes exist
-            self.adj.setdefault(frm, set()).add(to)
-            self.adj.setdefault(to, set())
-            # update out-degree cell if node already present
-            self._update_table_row(frm)
-            self._update_table_row(to)
-        elif isinstance(data, NodeInfo):
-            self.nodes[data.url] = data
-            self._upsert_table_row(data)
+    def on_progress(self, batch: list):
+        # batch holds ('node', NodeInfo) and ('edge', from, to) events for one page
+        self.table.setUpdatesEnabled(False)
+        try:
+            for event in batch:
+                if event[0] == 'edge':
+                    _, frm, to = event
+                    # ensure nodes exist
+                    self.adj.setdefault(frm, set()).add(to)
+                    self.adj.setdefault(to, set())
+                    # update out-degree cell if node already present
+                    self._update_table_row(frm)
+                    self._update_table_row(to)
+                elif event[0] == 'node':
+                    node = event[1]
+                    self.nodes[node.url] = node
+                    self._upsert_table_row(node)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def _upsert_table_row(self, node: NodeInfo):
         # find if URL exists in table
-        for r in range(self.table.rowCount()):
-            if self.table.item(r, 0) and self.table.item(r, 0).text() == node.url:
-                # update
-                self.table.setItem(r, 1, QTableWidgetItem(str(node.status)))
-                self.table.setItem(r, 2, QTableWidgetItem('Yes' if node.accepts_params else 'No'))
-                examples = '\n'.join(node.param_examples or [])
-                self.table.setItem(r, 3, QTableWidgetItem(examples))
-                self.table.setItem(r, 4, QTableWidgetItem(str(node.out_degree)))
-                return
+        r = self._row_by_url.get(node.url)
+        if r is not None:
+            # update
+            self.table.setItem(r, 1, QTableWidgetItem(str(node.status)))
+            self.table.setItem(r, 2, QTableWidgetItem('Yes' if node.accepts_params else 'No'))
+            examples = '\n'.join(node.param_examples or [])
+            self.table.setItem(r, 3, QTableWidgetItem(examples))
+            self.table.setItem(r, 4, QTableWidgetItem(str(node.out_degree)))
+            return
         # insert new row
         r = self.table.rowCount()
         self.table.insertRow(r)
+        self._row_by_url[node.url] = r
         self.table.setItem(r, 0, QTableWidgetItem(node.url))
         self.table.setItem(r, 1, QTableWidgetItem(str(node.status)))
         self.table.setItem(r, 2, QTableWidgetItem('Yes' if node.accepts_params else 'No'))
@@ -416,19 +626,25 @@ class MainWindow(QMainWindow):
         with open(path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['url', 'status', 'accepts_params', 'param_examples', 'out_degree'])
-            for n in self.nodes.values():
-                writer.writerow([n.url, n.status, n.accepts_params, json.dumps(n.param_examples or []), n.out_degree])
+            writer.writerows([n.url, n.status, n.accepts_params, json.dumps(n.param_examples or []), n.out_degree]
+                             for n in self.nodes.values())
         QMessageBox.information(self, 'Saved', f'CSV saved to {path}')
 
     def on_export_json(self):
         if not self.nodes:
             QMessageBox.information(self, 'No results', 'No crawl results to export.')
             return
-        path, _ = QFileDialog.getSaveFileName(self, 'Save JSON', 'crawl_results.json', 'JSON Files (*.json)')
+        path, selected = QFileDialog.getSaveFileName(self, 'Save JSON', 'crawl_results.json',
+                                                     'JSON Files (*.json);;JSON Lines (*.jsonl)')
         if not path:
             return
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump({u: n.to_dict() for u, n in self.nodes.items()}, f, ensure_ascii=False, indent=2)
+        with open(path, 'wb') as f:
+            if selected.startswith('JSON Lines') or path.endswith('.jsonl'):
+                # one node per line, written without building the whole document first
+                for n in self.nodes.values():
+                    f.write(dump_json(n.to_dict()) + b'\n')
+            else:
+                f.write(dump_json({u: n.to_dict() for u, n in self.nodes.items()}, indent=True))
         QMessageBox.information(self, 'Saved', f'JSON saved to {path}')
 
     def on_draw_graph(self):